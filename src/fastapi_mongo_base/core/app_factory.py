@@ -132,6 +132,11 @@ async def _startup_datasources(
 
     if use_redis:
         redis_sync, redis_async = db.init_redis(settings)
+        await db.warm_redis(
+            redis_async,
+            getattr(settings, "redis_prewarm_connections", 0),
+            getattr(settings, "redis_max_connections", None),
+        )
     else:
         redis_sync, redis_async = None, None
     app.state.redis_sync_client = redis_sync
@@ -79,6 +79,14 @@ class ProjectSettings(BaseSettings):
         validation_alias="SENTRY_SEND_DEFAULT_PII",
     )
     redis_uri: str | None = Field(default=None, validation_alias="REDIS_URI")
+    redis_max_connections: int | None = Field(
+        default=None,
+        validation_alias="REDIS_MAX_CONNECTIONS",
+    )
+    redis_prewarm_connections: int = Field(
+        default=0,
+        validation_alias="REDIS_PREWARM_CONNECTIONS",
+    )
     database_uri: str | None = Field(
         default=None,
         validation_alias="DATABASE_URI",
@@ -238,6 +246,8 @@ class Settings(metaclass=Singleton):
     )
     sentry_send_default_pii: bool = project_settings.sentry_send_default_pii
     redis_uri: str | None = project_settings.redis_uri
+    redis_max_connections: int | None = project_settings.redis_max_connections
+    redis_prewarm_connections: int = project_settings.redis_prewarm_connections
     database_uri: str | None = project_settings.database_uri
     database_echo: bool = project_settings.database_echo
     database_pool_size: int | None = project_settings.database_pool_size
@@ -16,6 +16,7 @@ from ..db import (
     init_mongo_db,
     init_redis,
     init_sql,
+    warm_redis,
 )
 
 __all__ = [
@@ -34,4 +35,5 @@ __all__ = [
     "init_mongo_db",
     "init_redis",
     "init_sql",
+    "warm_redis",
 ]
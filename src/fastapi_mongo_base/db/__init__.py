@@ -12,6 +12,7 @@ from .redis import (
     get_redis_async_client,
     get_redis_sync_client,
     init_redis,
+    warm_redis,
 )
 from .sql import (
     check_sql,
@@ -38,4 +39,5 @@ __all__ = [
     "init_mongo_db",
     "init_redis",
     "init_sql",
+    "warm_redis",
 ]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import inspect
 import logging
 
@@ -33,6 +34,18 @@ def get_redis_async_client() -> object:
     return _redis_async_client
 
 
+def _build_client_kwargs(settings: Settings) -> dict[str, object]:
+    """Build Redis client kwargs from settings."""
+    kwargs: dict[str, object] = {
+        "socket_connect_timeout": 1,
+        "socket_timeout": 1,
+    }
+    max_connections = getattr(settings, "redis_max_connections", None)
+    if max_connections is not None:
+        kwargs["max_connections"] = max_connections
+    return kwargs
+
+
 def init_redis(
     settings: Settings | None = None,
 ) -> tuple[object | None, object | None]:
@@ -71,17 +84,10 @@ def init_redis(
             "Install with: pip install 'fastapi-mongo-base[redis]'"
         ) from e
 
+    client_kwargs = _build_client_kwargs(settings)
     try:
-        redis_sync: RedisSync = RedisSync.from_url(
-            redis_uri,
-            socket_connect_timeout=1,
-            socket_timeout=1,
-        )
-        redis_async: Redis = Redis.from_url(
-            redis_uri,
-            socket_connect_timeout=1,
-            socket_timeout=1,
-        )
+        redis_sync: RedisSync = RedisSync.from_url(redis_uri, **client_kwargs)
+        redis_async: Redis = Redis.from_url(redis_uri, **client_kwargs)
         redis_sync.ping()
     except RedisError as e:
         logging.exception("Redis connection error at %s", redis_uri)
@@ -92,6 +98,44 @@ def init_redis(
     return redis_sync, redis_async
 
 
+async def warm_redis(
+    client: object | None,
+    connections: int,
+    max_connections: int | None = None,
+) -> None:
+    """
+    Open pooled async Redis connections ahead of the first request.
+
+    Concurrent pings each check out their own pooled connection, so the
+    pool holds ``connections`` established sockets once they return.
+
+    Args:
+        client: Async Redis client instance.
+        connections: Number of connections to open.
+        max_connections: Pool size limit; warm-up never exceeds it.
+
+    Raises:
+        RedisConnectionError: If any warm-up connection fails.
+
+    """
+    if max_connections is not None and connections > max_connections:
+        logging.warning(
+            "Capping Redis warm-up at %s connections (pool limit)",
+            max_connections,
+        )
+        connections = max_connections
+    if client is None or connections <= 0:
+        return
+
+    from redis.exceptions import RedisError
+
+    try:
+        await asyncio.gather(*(client.ping() for _ in range(connections)))
+    except RedisError as e:
+        logging.exception("Redis connection pool warm-up failed")
+        raise RedisConnectionError("Failed to connect to Redis") from e
+
+
 async def check_redis(client: object | None) -> str:
     """
     Ping Redis to verify readiness.
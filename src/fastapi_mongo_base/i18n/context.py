@@ -1,10 +1,9 @@
 """Request-scoped context for internationalization helpers."""
 
 from contextvars import ContextVar
+from datetime import tzinfo
 
-import pytz
-
-request_timezone: ContextVar[pytz.BaseTzInfo | None] = ContextVar(
+request_timezone: ContextVar[tzinfo | None] = ContextVar(
     "request_timezone",
     default=None,
 )
@@ -2,10 +2,9 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, tzinfo
 from typing import TYPE_CHECKING
-
-import pytz
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from ..utils import timezone as tz_util
 from .context import request_timezone
@@ -16,21 +15,36 @@ if TYPE_CHECKING:
 TIMEZONE_HEADER = "x-timezone"
 
 
-def parse_timezone(value: str | None) -> pytz.BaseTzInfo | None:
+def parse_timezone(value: str | None) -> tzinfo | None:
     """Parse an IANA timezone name, returning None when invalid."""
     if not value:
         return None
     try:
-        return pytz.timezone(value.strip())
-    except pytz.UnknownTimeZoneError:
+        return ZoneInfo(value.strip())
+    except (ZoneInfoNotFoundError, ValueError):
         return None
 
 
+def _as_zoneinfo(timezone: tzinfo) -> tzinfo:
+    """
+    Return a zone that is safe to attach with ``datetime.replace``.
+
+    pytz zones report their first historical (LMT) offset until localized,
+    so named ones are converted to ``ZoneInfo``; other zones pass through.
+    """
+    if isinstance(timezone, ZoneInfo):
+        return timezone
+    name = getattr(timezone, "zone", None)
+    if not isinstance(name, str):
+        return timezone
+    return parse_timezone(name) or timezone
+
+
 def resolve_request_timezone(
     request: Request,
     *,
-    user_timezone: str | pytz.BaseTzInfo | None = None,
-) -> pytz.BaseTzInfo:
+    user_timezone: str | tzinfo | None = None,
+) -> tzinfo:
     """
     Resolve the active timezone for a request.
 
@@ -45,7 +59,7 @@ def resolve_request_timezone(
         if isinstance(candidate, str):
             parsed = parse_timezone(candidate)
         else:
-            parsed = candidate
+            parsed = _as_zoneinfo(candidate)
         if parsed is not None:
             return parsed
     return tz_util.tz
@@ -53,9 +67,10 @@ def resolve_request_timezone(
 
 def set_request_timezone(
     request: Request,
-    timezone: pytz.BaseTzInfo,
+    timezone: tzinfo,
 ) -> None:
     """Store the resolved timezone on the request and in context."""
+    timezone = _as_zoneinfo(timezone)
     request.state.timezone = timezone
     request_timezone.set(timezone)
 
@@ -74,7 +89,7 @@ def apply_user_timezone(
         return
     if isinstance(user_tz, str):
         parsed = parse_timezone(user_tz)
-    elif isinstance(user_tz, pytz.BaseTzInfo):
+    elif isinstance(user_tz, tzinfo):
         parsed = user_tz
     else:
         return
@@ -85,16 +100,16 @@ def apply_user_timezone(
 def serialize_response_datetime(dt: datetime) -> str:
     """Serialize a datetime for API responses in the request timezone."""
     target_tz = request_timezone.get() or tz_util.tz
-    aware = tz_util.utc.localize(dt) if dt.tzinfo is None else dt
+    aware = dt.replace(tzinfo=tz_util.utc) if dt.tzinfo is None else dt
     return tz_util.iso_tz(aware, target_tz)
 
 
 def localize_filter_datetime(
     dt: datetime,
     *,
-    source_tz: pytz.BaseTzInfo | None = None,
+    source_tz: tzinfo | None = None,
 ) -> datetime:
     """Convert a naive or aware filter datetime to UTC for storage queries."""
-    active_tz = source_tz or request_timezone.get() or tz_util.tz
-    aware = active_tz.localize(dt) if dt.tzinfo is None else dt
+    active_tz = _as_zoneinfo(source_tz or request_timezone.get() or tz_util.tz)
+    aware = dt.replace(tzinfo=active_tz) if dt.tzinfo is None else dt
     return aware.astimezone(tz_util.utc)
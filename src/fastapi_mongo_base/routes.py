@@ -7,7 +7,7 @@ from enum import Enum
 from typing import cast
 
 import singleton
-from fastapi import APIRouter, BackgroundTasks, Query, Request
+from fastapi import APIRouter, BackgroundTasks, Query, Request, Response
 from pydantic import BaseModel
 
 from .core.config import Settings
@@ -46,6 +46,9 @@ class AbstractBaseRouter(metaclass=singleton.Singleton):
 
     unique_per_user: bool = False
     create_mine_if_not_found: bool = False
+    # Opt in to copying list items without validation when the list item
+    # schema's fields are all stored on the entity.
+    trust_db_values: bool = False
 
     def __init__(
         self,
@@ -85,10 +88,14 @@ class AbstractBaseRouter(metaclass=singleton.Singleton):
                 )
         else:
             self.schema = schema
+        self._model_name_lower = self.model.__name__.lower()
+        self._not_found_message = {
+            "en": f"{self.model.__name__.capitalize()} not found"
+        }
 
         self.user_dependency = user_dependency
         if prefix is None:
-            prefix = f"/{self.model.__name__.lower()}s"
+            prefix = f"/{self._model_name_lower}s"
         if tags is None:
             tags = [self.model.__name__]
 
@@ -273,12 +280,41 @@ class AbstractBaseRouter(metaclass=singleton.Singleton):
             raise BaseHTTPException(
                 status_code=404,
                 error_code="item_not_found",
-                message={
-                    "en": f"{self.model.__name__.capitalize()} not found"
-                },
+                message=dict(self._not_found_message),
             )
         return item
 
+    def _to_list_item(self, item: BaseModel) -> BaseModel:
+        """
+        Convert a loaded entity into the list item schema.
+
+        Entities that already are instances of the list item schema are
+        returned as-is; the page serializer emits only schema fields. Other
+        entities are validated from attributes, so computed fields,
+        properties and schema validators apply. With ``trust_db_values``
+        set, entities whose stored fields cover the schema are copied via
+        ``model_construct`` instead.
+
+        Args:
+            item: Entity instance loaded from the database.
+
+        Returns:
+            List item schema instance.
+
+        """
+        schema = self.list_item_schema
+        if isinstance(item, schema):
+            return item
+        if (
+            self.trust_db_values
+            and schema.model_fields.keys() <= type(item).model_fields.keys()
+        ):
+            values = item.__dict__
+            return schema.model_construct(**{
+                name: values[name] for name in schema.model_fields
+            })
+        return schema.model_validate(item, from_attributes=True)
+
     async def get_user(
         self, request: Request, **kwargs: object
     ) -> object | None:
@@ -402,11 +438,9 @@ class AbstractBaseRouter(metaclass=singleton.Singleton):
             limit=limit,
             **kwargs,
         )
-        items_in_schema = [
-            self.list_item_schema(**item.model_dump()) for item in items
-        ]
+        items_in_schema = [self._to_list_item(item) for item in items]
 
-        return PaginatedResponse(
+        return PaginatedResponse[self.list_item_schema](
             items=items_in_schema,
             total=total,
             offset=offset,
@@ -420,7 +454,7 @@ class AbstractBaseRouter(metaclass=singleton.Singleton):
         limit: int = Query(10, ge=1, le=Settings.page_max_limit),
         created_at_from: datetime | None = None,
         created_at_to: datetime | None = None,
-    ) -> PaginatedResponse[BaseEntitySchema]:
+    ) -> PaginatedResponse[BaseEntitySchema] | Response:
         """
         List items endpoint handler.
 
@@ -435,13 +469,43 @@ class AbstractBaseRouter(metaclass=singleton.Singleton):
             PaginatedResponse with items and metadata.
 
         """
-        return await self._list_items(
+        resp = await self._list_items(
             request=request,
             offset=offset,
             limit=limit,
             created_at_from=created_at_from,
             created_at_to=created_at_to,
         )
+        return self._list_response(resp)
+
+    def _list_response(
+        self, resp: PaginatedResponse
+    ) -> PaginatedResponse | Response:
+        """
+        Serialize a page in one pass with the pydantic-core serializer.
+
+        Pages that already match ``list_response_schema`` are rendered
+        directly to JSON, skipping FastAPI's revalidation and
+        ``jsonable_encoder`` pass. That is only safe when every item was
+        validated, so routers with ``trust_db_values`` set, and any other
+        values, are returned unchanged for FastAPI to validate against the
+        route's response model as usual.
+
+        Args:
+            resp: Paginated response returned by ``_list_items``.
+
+        Returns:
+            JSON response, or the page itself when it cannot be fast-pathed.
+
+        """
+        if self.trust_db_values or not isinstance(
+            resp, self.list_response_schema
+        ):
+            return resp
+        return Response(
+            content=resp.__pydantic_serializer__.to_json(resp, by_alias=True),
+            media_type="application/json",
+        )
 
     async def retrieve_item(
         self,
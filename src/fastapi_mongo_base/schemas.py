@@ -286,9 +286,15 @@ class PaginatedResponse(BaseModel, Generic[TSchema]):
             return self
         if not self.items:
             return self
+        args = self.__pydantic_generic_metadata__["args"]
+        item_type = args[0] if args else None
+        if not (
+            isinstance(item_type, type) and issubclass(item_type, BaseModel)
+        ):
+            item_type = self.items[0].__class__
         self.heads = {
             field: {"en": field.replace("_", " ").title()}
-            for field in self.items[0].__class__.model_fields
+            for field in item_type.model_fields
         }
         return self
 
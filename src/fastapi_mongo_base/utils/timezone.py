@@ -1,15 +1,15 @@
 """Timezone utilities for the application."""
 
 import os
-from datetime import datetime
+from datetime import datetime, tzinfo
+from datetime import timezone as dt_timezone
+from zoneinfo import ZoneInfo
 
-import pytz
+tz = ZoneInfo(os.getenv("TIMEZONE", "UTC"))
+utc = dt_timezone.utc
 
-tz = pytz.timezone(os.getenv("TIMEZONE", "UTC"))
-utc = pytz.timezone("UTC")
 
-
-def iso_tz(dt: datetime, timezone: pytz.timezone = tz) -> str:
+def iso_tz(dt: datetime, timezone: tzinfo = tz) -> str:
     """
     Convert a datetime object to a ISO string with the given timezone.
 
@@ -30,7 +30,7 @@ def iso_tz(dt: datetime, timezone: pytz.timezone = tz) -> str:
     return dt.replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
 
-def ensure_aware(dt: datetime, timezone: pytz.timezone = tz) -> datetime:
+def ensure_aware(dt: datetime, timezone: tzinfo = tz) -> datetime:
     """
     Ensure a datetime object is aware.
 
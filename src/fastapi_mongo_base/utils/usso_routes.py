@@ -1,5 +1,6 @@
 """Authenticated router using USSO for FastAPI MongoDB base package."""
 
+import functools
 import os
 from collections.abc import Callable
 
@@ -26,6 +27,26 @@ try:
 except ImportError as e:
     raise ImportError("USSO is not installed") from e
 
+DEFAULT_USSO_BASE_URL = "https://usso.uln.me"
+
+# Ownership fields checked for every router, on top of its owner_attr.
+_OWNERSHIP_FIELDS = frozenset({"uid", "tenant_id", "user_id", "workspace_id"})
+
+
+@functools.lru_cache(maxsize=8)
+def _build_usso(usso_base_url: str) -> USSOAuthentication:
+    """Build and cache the USSO authenticator for a base URL."""
+    return USSOAuthentication(
+        jwt_config=AuthConfig(
+            jwks_url=f"{usso_base_url}/.well-known/jwks.json",
+            api_key_header=APIHeaderConfig(
+                header_name="x-api-key",
+                verify_endpoint=f"{usso_base_url}/api/sso/v1/apikeys/verify",
+            ),
+        ),
+        from_usso_base_url=usso_base_url,
+    )
+
 
 class AbstractUSSORouterBase(AbstractBaseRouter):
     """
@@ -38,6 +59,12 @@ class AbstractUSSORouterBase(AbstractBaseRouter):
       (default: get_owner_id).
     """
 
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        """Precompute per-class ownership helpers from owner_attr."""
+        super().__init_subclass__(**kwargs)
+        cls._ignore_attr = f"ignore_{cls.owner_attr}"
+        cls._auth_fields = _OWNERSHIP_FIELDS | {cls.owner_attr}
+
     def _resolve_owner_id(self, user: UserData) -> str:
         """Resolve owner id. Override in subclasses for custom validation."""
         return self.get_owner_id(user)
@@ -48,6 +75,10 @@ class AbstractUSSORouterBase(AbstractBaseRouter):
 
     # Override in subclasses: "user_id" or "owner_id"
     owner_attr: str = "user_id"
+    # Derived from owner_attr when the subclass is created.
+    _ignore_attr: str = "ignore_user_id"
+    # Item fields dumped for ownership checks in _authorize_item().
+    _auth_fields: frozenset[str] = _OWNERSHIP_FIELDS
 
     get_owner_id: Callable[[type["AbstractUSSORouterBase"], UserData], str] = (
         lambda self, u: getattr(u, "uid", u.user_id)
@@ -71,9 +102,13 @@ class AbstractUSSORouterBase(AbstractBaseRouter):
             return self.get_owner_id_for_create(user)
         return self._resolve_owner_id(user)
 
-    @property
+    @functools.cached_property
     def resource_path(self) -> str:
-        """Resource path for USSO (namespace/service/resource)."""
+        """
+        Resource path for USSO (namespace/service/resource).
+
+        Computed once per router; the environment is only read on first use.
+        """
         namespace = (
             getattr(self, "namespace", None)
             or os.getenv("USSO_NAMESPACE")
@@ -85,24 +120,12 @@ class AbstractUSSORouterBase(AbstractBaseRouter):
             or os.getenv("PROJECT_NAME")
             or ""
         )
-        resource = self.resource or self.model.__name__.lower() or ""
+        resource = self.resource or self._model_name_lower or ""
         return f"{namespace}/{service}/{resource}".lstrip("/")
 
     async def get_user(self, request: Request, **kwargs: object) -> UserData:
         """Resolve authenticated user from request."""
-        usso_base_url = os.getenv("USSO_BASE_URL") or "https://usso.uln.me"
-        usso = USSOAuthentication(
-            jwt_config=AuthConfig(
-                jwks_url=f"{usso_base_url}/.well-known/jwks.json",
-                api_key_header=APIHeaderConfig(
-                    header_name="x-api-key",
-                    verify_endpoint=(
-                        f"{usso_base_url}/api/sso/v1/apikeys/verify"
-                    ),
-                ),
-            ),
-            from_usso_base_url=usso_base_url,
-        )
+        usso = _build_usso(os.getenv("USSO_BASE_URL") or DEFAULT_USSO_BASE_URL)
         user = usso(request)
         apply_user_timezone(request, user)
         return user
@@ -162,13 +185,37 @@ class AbstractUSSORouterBase(AbstractBaseRouter):
             return False
         return True
 
+    async def _authorize_item(
+        self, *, action: str, user: UserData | None, item: BaseModel
+    ) -> bool:
+        """
+        Authorize an action on a loaded item.
+
+        Ownership is checked against the item's ownership fields only; the
+        full item is dumped for scope checks when that fails. Scope filters
+        only match keys that are present, so the narrow dump never grants
+        access the full one would deny.
+        """
+        if await self.authorize(
+            action=action,
+            user=user,
+            filter_data=item.model_dump(include=self._auth_fields),
+            raise_exception=False,
+        ):
+            return True
+        return await self.authorize(
+            action=action, user=user, filter_data=item.model_dump()
+        )
+
     def get_list_filter_queries(self, *, user: UserData) -> dict:
         """Build list query filters from user and scopes."""
-        matched_scopes: list[dict] = authorization.get_scope_filters(
-            action="read",
-            resource=self.resource_path,
-            user_scopes=user.scopes if user else [],
-        )
+        matched_scopes: list[dict] = []
+        if user and user.scopes:
+            matched_scopes = authorization.get_scope_filters(
+                action="read",
+                resource=self.resource_path,
+                user_scopes=user.scopes,
+            )
         if self.self_access and hasattr(self.model, self.owner_attr):
             matched_scopes.append({
                 self.owner_attr: self._resolve_owner_id(user)
@@ -185,7 +232,7 @@ class AbstractUSSORouterBase(AbstractBaseRouter):
         **kwargs: object,
     ) -> BaseEntity:
         """Fetch one item by uid; raise if not found."""
-        ignore_attr = f"ignore_{self.owner_attr}"
+        ignore_attr = self._ignore_attr
         owner_value = kwargs.pop(self.owner_attr, None)
         ignore_val = kwargs.pop(ignore_attr, True)
         item_kw = {self.owner_attr: owner_value, ignore_attr: ignore_val}
@@ -233,16 +280,16 @@ class AbstractUSSORouterBase(AbstractBaseRouter):
                 items=[], total=0, offset=offset, limit=limit
             )
 
+        # kwargs is already a fresh dict for this call; merge in place.
+        kwargs.update(filters)
         items, total = await self.model.list_total_combined(
             offset=offset,
             limit=limit,
             tenant_id=user.tenant_id,
-            **(kwargs | filters),
+            **kwargs,
         )
-        items_in_schema = [
-            self.list_item_schema.model_validate(item) for item in items
-        ]
-        return PaginatedResponse(
+        items_in_schema = [self._to_list_item(item) for item in items]
+        return PaginatedResponse[self.list_item_schema](
             items=items_in_schema,
             total=total,
             offset=offset,
@@ -270,11 +317,7 @@ class AbstractUSSORouterBase(AbstractBaseRouter):
         item = await self.get_item(
             uid=uid, tenant_id=user.tenant_id, **{self.owner_attr: None}
         )
-        await self.authorize(
-            action="read",
-            user=user,
-            filter_data=item.model_dump(),
-        )
+        await self._authorize_item(action="read", user=user, item=item)
         return item
 
     async def create_item(self, request: Request, data: dict) -> BaseEntity:
@@ -330,11 +373,7 @@ class AbstractUSSORouterBase(AbstractBaseRouter):
         item = await self.get_item(
             uid=uid, tenant_id=user.tenant_id, **{self.owner_attr: None}
         )
-        await self.authorize(
-            action="update",
-            user=user,
-            filter_data=item.model_dump(),
-        )
+        await self._authorize_item(action="update", user=user, item=item)
         from ..audit.context import audit_actor_scope
 
         with audit_actor_scope(user):
@@ -360,11 +399,7 @@ class AbstractUSSORouterBase(AbstractBaseRouter):
         item = await self.get_item(
             uid=uid, tenant_id=user.tenant_id, **{self.owner_attr: None}
         )
-        await self.authorize(
-            action="delete",
-            user=user,
-            filter_data=item.model_dump(),
-        )
+        await self._authorize_item(action="delete", user=user, item=item)
         from ..audit.context import audit_actor_scope
 
         with audit_actor_scope(user):
@@ -1,10 +1,13 @@
 """Test API endpoints."""
 
 import logging
+from unittest.mock import patch
 
 import httpx
 import pytest
 
+from .app import server
+
 
 @pytest.mark.asyncio
 async def test_empty(client: httpx.AsyncClient) -> None:
@@ -62,6 +65,36 @@ async def test_list(client: httpx.AsyncClient) -> None:
     logging.info(response.json())
 
 
+@pytest.mark.asyncio
+async def test_list_body_matches_response_model(
+    client: httpx.AsyncClient,
+) -> None:
+    """
+    Test the list body is the same as FastAPI's response model output.
+
+    Args:
+        client: Async client.
+
+    Returns:
+        None.
+
+    """
+    response = await client.post("/test", json={"name": "timezone"})
+    assert response.status_code == 201
+    headers = {"x-timezone": "Asia/Tehran"}
+
+    response = await client.get("/test", headers=headers)
+    with patch.object(
+        server.TestRouter, "_list_response", lambda self, resp: resp
+    ):
+        expected = await client.get("/test", headers=headers)
+
+    assert response.status_code == expected.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.content == expected.content
+    assert response.json()["items"][0]["created_at"].endswith("+03:30")
+
+
 @pytest.mark.asyncio
 async def test_update(client: httpx.AsyncClient) -> None:
     """
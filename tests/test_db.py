@@ -14,6 +14,7 @@ from src.fastapi_mongo_base.core.db import (
     init_mongo_db,
     init_redis,
     init_sql,
+    warm_redis,
 )
 from src.fastapi_mongo_base.errors.mongodb import (
     MongoDBConnectionError,
@@ -150,6 +151,69 @@ def test_init_redis_raises_on_connection_failure() -> None:
         init_redis(settings)
 
 
+def test_init_redis_passes_max_connections() -> None:
+    """Configured pool size must reach both Redis clients."""
+    pytest.importorskip("redis")
+
+    settings = dataclasses.make_dataclass(
+        "_RedisSettings",
+        [
+            ("redis_uri", str, "redis://localhost:6379/0"),
+            ("redis_max_connections", int, 32),
+        ],
+    )()
+
+    with (
+        patch("redis.asyncio.client.Redis") as async_ctor,
+        patch("redis.Redis") as sync_ctor,
+    ):
+        init_redis(settings)
+
+    for ctor in (sync_ctor, async_ctor):
+        kwargs = ctor.from_url.call_args.kwargs
+        assert kwargs["max_connections"] == 32
+        assert kwargs["socket_timeout"] == 1
+
+
+@pytest.mark.asyncio
+async def test_warm_redis_opens_requested_connections() -> None:
+    """Warm-up should issue one concurrent ping per requested connection."""
+    pytest.importorskip("redis")
+    mock_client = MagicMock()
+    mock_client.ping = AsyncMock(return_value=True)
+
+    await warm_redis(mock_client, 3)
+    assert mock_client.ping.await_count == 3
+
+    await warm_redis(mock_client, 0)
+    await warm_redis(None, 3)
+    assert mock_client.ping.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_warm_redis_caps_at_max_connections() -> None:
+    """Warm-up must not open more connections than the pool allows."""
+    pytest.importorskip("redis")
+    mock_client = MagicMock()
+    mock_client.ping = AsyncMock(return_value=True)
+
+    await warm_redis(mock_client, 10, max_connections=4)
+    assert mock_client.ping.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_warm_redis_raises_on_failure() -> None:
+    """Warm-up failures must surface as RedisConnectionError."""
+    pytest.importorskip("redis")
+    from redis.exceptions import RedisError
+
+    mock_client = MagicMock()
+    mock_client.ping = AsyncMock(side_effect=RedisError("down"))
+
+    with pytest.raises(RedisConnectionError):
+        await warm_redis(mock_client, 2)
+
+
 @dataclasses.dataclass
 class _TestSqlSettings:
     database_uri: str = "sqlite+aiosqlite:///:memory:"
@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 from datetime import datetime
+from zoneinfo import ZoneInfo
 
 import pytest
-import pytz
 from fastapi import FastAPI, Request
 
 try:
@@ -27,6 +27,8 @@ from src.fastapi_mongo_base.schemas import BaseEntitySchema
 from src.fastapi_mongo_base.tasks import TaskLogRecord, TaskMixin
 from src.fastapi_mongo_base.utils import timezone as tz_util
 
+UTC = ZoneInfo("UTC")
+
 
 def _request(headers: list[tuple[bytes, bytes]] | None = None) -> Request:
     return Request({
@@ -81,7 +83,7 @@ def test_apply_user_timezone_overrides_request_state() -> None:
         timezone = "Asia/Tehran"
 
     request = _request([(b"x-timezone", b"Europe/Berlin")])
-    set_request_timezone(request, pytz.timezone("UTC"))
+    set_request_timezone(request, UTC)
     apply_user_timezone(request, _User())
 
     assert str(request.state.timezone) == "Asia/Tehran"
@@ -90,9 +92,9 @@ def test_apply_user_timezone_overrides_request_state() -> None:
 
 def test_serialize_response_datetime_uses_context() -> None:
     """Datetime serialization converts UTC storage to request timezone."""
-    token = request_timezone.set(pytz.timezone("Asia/Tehran"))
+    token = request_timezone.set(ZoneInfo("Asia/Tehran"))
     try:
-        dt = datetime(2024, 6, 1, 12, 0, 0, tzinfo=pytz.UTC)
+        dt = datetime(2024, 6, 1, 12, 0, 0, tzinfo=UTC)
         result = serialize_response_datetime(dt)
         assert result == "2024-06-01T15:30:00+03:30"
     finally:
@@ -101,7 +103,7 @@ def test_serialize_response_datetime_uses_context() -> None:
 
 def test_serialize_response_datetime_treats_naive_as_utc() -> None:
     """Naive datetimes are interpreted as UTC before conversion."""
-    token = request_timezone.set(pytz.UTC)
+    token = request_timezone.set(UTC)
     try:
         dt = datetime(2024, 6, 1, 12, 0, 0)
         assert serialize_response_datetime(dt) == "2024-06-01T12:00:00Z"
@@ -111,25 +113,53 @@ def test_serialize_response_datetime_treats_naive_as_utc() -> None:
 
 def test_localize_filter_datetime_converts_to_utc() -> None:
     """Filter datetimes are converted from request timezone to UTC."""
-    token = request_timezone.set(pytz.timezone("Asia/Tehran"))
+    token = request_timezone.set(ZoneInfo("Asia/Tehran"))
     try:
         local = datetime(2024, 6, 1, 15, 30, 0)
         utc_dt = localize_filter_datetime(local)
-        assert utc_dt == datetime(2024, 6, 1, 12, 0, 0, tzinfo=pytz.UTC)
+        assert utc_dt == datetime(2024, 6, 1, 12, 0, 0, tzinfo=UTC)
     finally:
         request_timezone.reset(token)
 
 
+def test_localize_filter_datetime_normalizes_pytz_zones() -> None:
+    """Legacy pytz zones use the real offset, not their LMT default."""
+    pytz = pytest.importorskip("pytz")
+    local = datetime(2024, 6, 1, 15, 30, 0)
+    utc_dt = localize_filter_datetime(
+        local, source_tz=pytz.timezone("Asia/Tehran")
+    )
+    assert utc_dt == datetime(2024, 6, 1, 12, 0, 0, tzinfo=UTC)
+
+
+def test_user_pytz_timezone_is_stored_as_zoneinfo() -> None:
+    """A pytz user timezone is converted before reaching the context."""
+    pytz = pytest.importorskip("pytz")
+
+    class _User:
+        timezone = pytz.timezone("Asia/Tehran")
+
+    request = _request()
+    apply_user_timezone(request, _User())
+
+    assert request.state.timezone == ZoneInfo("Asia/Tehran")
+    assert request_timezone.get() == ZoneInfo("Asia/Tehran")
+    local = datetime(2024, 6, 1, 15, 30, 0)
+    assert localize_filter_datetime(local) == datetime(
+        2024, 6, 1, 12, 0, 0, tzinfo=UTC
+    )
+
+
 def test_base_entity_schema_serializes_created_at_in_request_timezone() -> (
     None
 ):
     """BaseEntitySchema JSON output uses request timezone."""
-    token = request_timezone.set(pytz.timezone("Asia/Tehran"))
+    token = request_timezone.set(ZoneInfo("Asia/Tehran"))
     try:
         schema = BaseEntitySchema(
             uid="item-1",
-            created_at=datetime(2024, 6, 1, 12, 0, 0, tzinfo=pytz.UTC),
-            updated_at=datetime(2024, 6, 1, 12, 0, 0, tzinfo=pytz.UTC),
+            created_at=datetime(2024, 6, 1, 12, 0, 0, tzinfo=UTC),
+            updated_at=datetime(2024, 6, 1, 12, 0, 0, tzinfo=UTC),
         )
         payload = schema.model_dump(mode="json")
         assert payload["created_at"] == "2024-06-01T15:30:00+03:30"
@@ -144,10 +174,10 @@ class _TaskEntity(TaskMixin):
 
 def test_task_mixin_serializes_task_datetimes() -> None:
     """TaskMixin exposes timezone-aware task timestamps in JSON."""
-    token = request_timezone.set(pytz.UTC)
+    token = request_timezone.set(UTC)
     try:
         task = _TaskEntity(
-            task_start_at=datetime(2024, 6, 1, 8, 0, 0, tzinfo=pytz.UTC),
+            task_start_at=datetime(2024, 6, 1, 8, 0, 0, tzinfo=UTC),
             task_end_at=None,
         )
         payload = task.model_dump(mode="json")
@@ -159,10 +189,10 @@ def test_task_mixin_serializes_task_datetimes() -> None:
 
 def test_task_log_record_serializes_reported_at() -> None:
     """Task log records serialize reported_at in request timezone."""
-    token = request_timezone.set(pytz.UTC)
+    token = request_timezone.set(UTC)
     try:
         record = TaskLogRecord(
-            reported_at=datetime(2024, 6, 1, 8, 0, 0, tzinfo=pytz.UTC),
+            reported_at=datetime(2024, 6, 1, 8, 0, 0, tzinfo=UTC),
             message="done",
             task_status="done",
         )
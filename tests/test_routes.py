@@ -0,0 +1,179 @@
+"""Tests for AbstractBaseRouter list helpers."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import Response
+from pydantic import BaseModel, ValidationError, computed_field
+
+from src.fastapi_mongo_base.errors.base import BaseHTTPException
+from src.fastapi_mongo_base.routes import AbstractBaseRouter
+from src.fastapi_mongo_base.schemas import PaginatedResponse
+
+
+class _ItemSchema(BaseModel):
+    uid: str = "item-1"
+    user_id: str | None = None
+
+
+class _Router(AbstractBaseRouter):
+    model = MagicMock()
+    schema = _ItemSchema
+
+
+@pytest.fixture()
+def base_router() -> _Router:
+    """Fixture for a router built without registering routes."""
+    router = object.__new__(_Router)
+    router.model = MagicMock()
+    router.schema = _ItemSchema
+    return router
+
+
+def test_to_list_item_returns_schema_instances_unchanged(
+    base_router: _Router,
+) -> None:
+    """Entities that already are list schema instances are not copied."""
+    base_router.list_item_schema = _ItemSchema
+    item = _ItemSchema(uid="item-1", user_id="user-1")
+    assert base_router._to_list_item(item) is item
+
+
+class _StoredItem(BaseModel):
+    uid: str
+    user_id: str | None = None
+    note: str = "stored only"
+
+
+def test_to_list_item_constructs_trusted_foreign_items(
+    base_router: _Router,
+) -> None:
+    """Trusted items of another type are copied without validation."""
+    base_router.list_item_schema = _ItemSchema
+    base_router.trust_db_values = True
+    item = _StoredItem(uid="item-1", user_id="user-1")
+    with patch.object(_ItemSchema, "model_validate") as validate:
+        result = base_router._to_list_item(item)
+    validate.assert_not_called()
+    assert result == _ItemSchema(uid="item-1", user_id="user-1")
+
+
+def test_to_list_item_validates_by_default(
+    base_router: _Router,
+) -> None:
+    """Items of another type are validated from attributes by default."""
+    base_router.list_item_schema = _ItemSchema
+    item = _StoredItem(uid="item-1", user_id="user-1")
+    result = base_router._to_list_item(item)
+    assert isinstance(result, _ItemSchema)
+    assert result.uid == "item-1"
+    assert result.user_id == "user-1"
+
+
+class _LabelledEntity(BaseModel):
+    uid: str
+    name: str
+
+    @computed_field
+    @property
+    def label(self) -> str:
+        return self.name.title()
+
+
+class _LabelSchema(BaseModel):
+    uid: str
+    label: str
+
+
+@pytest.mark.parametrize("trust_db_values", [False, True])
+def test_to_list_item_reads_computed_fields_of_other_types(
+    base_router: _Router,
+    trust_db_values: bool,
+) -> None:
+    """Custom list schemas get computed fields from unrelated entities."""
+    base_router.list_item_schema = _LabelSchema
+    base_router.trust_db_values = trust_db_values
+    item = _LabelledEntity(uid="1", name="first item")
+    result = base_router._to_list_item(item)
+    assert result.model_dump_json() == '{"uid":"1","label":"First Item"}'
+
+
+class _StrictLabelSchema(BaseModel):
+    uid: str
+    title: str
+
+
+def test_to_list_item_rejects_missing_required_fields(
+    base_router: _Router,
+) -> None:
+    """Fields the entity lacks fail validation instead of being dropped."""
+    base_router.list_item_schema = _StrictLabelSchema
+    base_router.trust_db_values = True
+    with pytest.raises(ValidationError):
+        base_router._to_list_item(_LabelledEntity(uid="1", name="first"))
+
+
+def test_list_response_serializes_matching_page_to_json(
+    base_router: _Router,
+) -> None:
+    """Pages matching the response schema are rendered directly."""
+    base_router.list_response_schema = PaginatedResponse[_ItemSchema]
+    resp = PaginatedResponse[_ItemSchema](
+        items=[_ItemSchema(uid="item-1")], total=1
+    )
+    result = base_router._list_response(resp)
+    assert isinstance(result, Response)
+    assert result.media_type == "application/json"
+    assert json.loads(result.body)["items"][0]["uid"] == "item-1"
+
+
+def test_list_response_passes_through_trusted_pages(
+    base_router: _Router,
+) -> None:
+    """Pages built without validation are left for FastAPI to validate."""
+    base_router.list_response_schema = PaginatedResponse[_ItemSchema]
+    base_router.trust_db_values = True
+    resp = PaginatedResponse[_ItemSchema](
+        items=[_ItemSchema.model_construct(uid="item-1")], total=1
+    )
+    assert base_router._list_response(resp) is resp
+
+
+def test_list_response_passes_through_other_pages(
+    base_router: _Router,
+) -> None:
+    """Pages of another shape are left for FastAPI to validate."""
+    base_router.list_response_schema = PaginatedResponse[_ItemSchema]
+    resp = PaginatedResponse(items=[], total=0)
+    assert base_router._list_response(resp) is resp
+
+
+class _StoredEntity(_ItemSchema):
+    internal_note: str = "db-only"
+
+
+def test_page_heads_follow_declared_item_schema() -> None:
+    """Heads list schema fields even when items are entity subclasses."""
+    page = PaginatedResponse[_ItemSchema](
+        items=[_StoredEntity(uid="item-1")], total=1
+    )
+    assert set(page.heads) == {"uid", "user_id"}
+    body = json.loads(page.__pydantic_serializer__.to_json(page))
+    assert "internal_note" not in body["items"][0]
+
+
+@pytest.mark.asyncio
+async def test_get_item_raises_fresh_not_found_message(
+    base_router: _Router,
+) -> None:
+    """Each 404 gets its own copy of the precomputed message."""
+    base_router._not_found_message = {"en": "Item not found"}
+    base_router.model.get_item = AsyncMock(return_value=None)
+    with pytest.raises(BaseHTTPException) as exc_info:
+        await base_router.get_item(uid="missing")
+    assert exc_info.value.status_code == 404
+    assert exc_info.value.message == {"en": "Item not found"}
+    assert exc_info.value.message is not base_router._not_found_message
@@ -24,6 +24,7 @@ from src.fastapi_mongo_base.errors.status import (
 from src.fastapi_mongo_base.utils.usso_routes import (
     AbstractOwnedUSSORouter,
     AbstractTenantUSSORouter,
+    _build_usso,
 )
 
 _AUTH = "src.fastapi_mongo_base.utils.usso_routes.authorization"
@@ -78,6 +79,25 @@ def test_resource_path_builds_namespace_service_resource(
     assert tenant_router.resource_path == "ns/svc/items"
 
 
+def test_resource_path_is_computed_once(
+    tenant_router: _TenantRouter,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """resource_path is cached on the router after first access."""
+    tenant_router.namespace = None
+    monkeypatch.setenv("USSO_NAMESPACE", "env-ns")
+    assert tenant_router.resource_path == "env-ns/svc/items"
+    monkeypatch.setenv("USSO_NAMESPACE", "other-ns")
+    assert tenant_router.resource_path == "env-ns/svc/items"
+
+
+def test_build_usso_reuses_authenticator_per_base_url() -> None:
+    """USSO authenticator is built once per base URL."""
+    first = _build_usso("https://usso.example")
+    assert _build_usso("https://usso.example") is first
+    assert _build_usso("https://other.example") is not first
+
+
 @pytest.mark.asyncio
 async def test_authorize_raises_unauthorized_when_user_missing(
     tenant_router: _TenantRouter,
@@ -113,6 +133,47 @@ async def test_authorize_owner_authorization_short_circuit(
         assert await tenant_router.authorize(action="read", user=user) is True
 
 
+@pytest.mark.asyncio
+async def test_authorize_item_passes_ownership_fields_only(
+    tenant_router: _TenantRouter,
+) -> None:
+    """Owner access is decided on a dict of the item's ownership fields."""
+    user = UserData(sub="user-1", tenant_id="t1", scopes=[])
+    item = _ItemSchema(uid="item-1", user_id="user-1", owner_id="o-1")
+    with patch.object(
+        tenant_router, "authorize", AsyncMock(return_value=True)
+    ) as authorize:
+        assert await tenant_router._authorize_item(
+            action="read", user=user, item=item
+        )
+    authorize.assert_awaited_once_with(
+        action="read",
+        user=user,
+        filter_data={"uid": "item-1", "user_id": "user-1", "tenant_id": None},
+        raise_exception=False,
+    )
+
+
+@pytest.mark.asyncio
+async def test_authorize_item_dumps_full_item_for_scope_checks(
+    tenant_router: _TenantRouter,
+) -> None:
+    """Scope checks see the whole item when ownership does not match."""
+    user = UserData(sub="user-2", tenant_id="t1", scopes=["*:*"])
+    item = _ItemSchema(uid="item-1", user_id="user-1", owner_id="o-1")
+    with patch.object(
+        tenant_router, "authorize", AsyncMock(side_effect=[False, True])
+    ) as authorize:
+        assert await tenant_router._authorize_item(
+            action="update", user=user, item=item
+        )
+    assert authorize.await_args.kwargs == {
+        "action": "update",
+        "user": user,
+        "filter_data": item.model_dump(),
+    }
+
+
 @pytest.mark.asyncio
 async def test_authorize_raises_forbidden_when_scopes_deny(
     tenant_router: _TenantRouter,
@@ -192,6 +253,24 @@ def test_get_list_filter_queries_denies_without_scopes(
         assert router.get_list_filter_queries(user=user) == {"__deny__": True}
 
 
+def test_get_list_filter_queries_skips_scope_parsing_without_scopes(
+    tenant_router: _TenantRouter,
+) -> None:
+    """Users without scopes only get the owner filter."""
+    user = UserData(sub="user-1", tenant_id="t1", scopes=[])
+    tenant_router.model = MagicMock()
+    with (
+        patch(f"{_AUTH}.get_scope_filters") as get_scope_filters,
+        patch(
+            f"{_AUTH}.broadest_scope_filter",
+            side_effect=lambda scopes: scopes[0],
+        ),
+    ):
+        filters = tenant_router.get_list_filter_queries(user=user)
+    get_scope_filters.assert_not_called()
+    assert filters == {"user_id": "user-1"}
+
+
 @pytest.mark.asyncio
 async def test_get_item_raises_not_found(tenant_router: _TenantRouter) -> None:
     """get_item raises NotFoundError when model returns None."""
@@ -200,6 +279,36 @@ async def test_get_item_raises_not_found(tenant_router: _TenantRouter) -> None:
         await tenant_router.get_item(uid="missing", tenant_id="t1")
 
 
+def test_subclasses_precompute_owner_helpers() -> None:
+    """Ignore flag and ownership fields follow each class's owner_attr."""
+    assert _TenantRouter._ignore_attr == "ignore_user_id"
+    assert _OwnedRouter._ignore_attr == "ignore_owner_id"
+    assert _OwnedRouter._auth_fields == {
+        "uid",
+        "tenant_id",
+        "user_id",
+        "workspace_id",
+        "owner_id",
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_item_uses_owner_specific_ignore_flag(
+    owned_router: _OwnedRouter,
+) -> None:
+    """get_item forwards the ignore flag derived from owner_attr."""
+    item = MagicMock()
+    owned_router.model.get_item = AsyncMock(return_value=item)
+    assert await owned_router.get_item(uid="item-1", tenant_id="t1") is item
+    owned_router.model.get_item.assert_awaited_once_with(
+        uid="item-1",
+        tenant_id="t1",
+        is_deleted=False,
+        owner_id=None,
+        ignore_owner_id=True,
+    )
+
+
 @pytest.mark.asyncio
 async def test_list_items_raises_forbidden_on_deny(
     tenant_router: _TenantRouter,
@@ -290,6 +399,32 @@ async def test_list_items_returns_paginated_response(
         resp = await tenant_router._list_items(request, offset=0, limit=10)
     assert resp.total == 1
     assert len(resp.items) == 1
+    tenant_router.model.list_total_combined.assert_awaited_once_with(
+        offset=0, limit=10, tenant_id="t1"
+    )
+
+
+@pytest.mark.asyncio
+async def test_list_items_merges_filters_into_query(
+    tenant_router: _TenantRouter,
+) -> None:
+    """Scope filters override caller kwargs in the list query."""
+    request = MagicMock()
+    user = UserData(sub="user-1", tenant_id="t1", scopes=["*:*"])
+    tenant_router.list_item_schema = _ItemSchema
+    tenant_router.get_user = AsyncMock(return_value=user)
+    tenant_router.model.list_total_combined = AsyncMock(return_value=([], 0))
+    with patch.object(
+        tenant_router,
+        "get_list_filter_queries",
+        return_value={"user_id": "user-1"},
+    ):
+        await tenant_router._list_items(
+            request, offset=5, limit=10, user_id="other", title="x"
+        )
+    tenant_router.model.list_total_combined.assert_awaited_once_with(
+        offset=5, limit=10, tenant_id="t1", user_id="user-1", title="x"
+    )
 
 
 @pytest.mark.asyncio